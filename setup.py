@@ -27,13 +27,12 @@ def _get_requirements():
         "appdirs>=1.4.0",
         "py>=1.4.31",
         "pyttsx>=1.1",
-        "textstat>=0.3.1",
     ]
 
-    if "win32" in sys.platform:
+    if sys.platform.startswith("win"):
         # Should probably include PyWin32.
         raise NotImplementedError()
-    elif "darwin" in sys.platform:
+    elif sys.platform.startswith("darwin"):
         requirements.extend([
             "pyobjc>=3.1.1",
         ])
@@ -41,6 +40,9 @@ def _get_requirements():
     return requirements
 
 
+REQUIREMENTS = _get_requirements()
+
+
 setup(
     name="stenodictate",
     version=_get_version(),
@@ -52,5 +54,5 @@ setup(
     license="GPL3",
     packages=["stenodictate"],
     cmdclass=cmdclass,
-    install_requires=_get_requirements(),
+    install_requires=REQUIREMENTS,
 )
@@ -14,7 +14,8 @@ import threading
 import time
 
 import pyttsx
-from textstat.textstat import textstat
+
+from stenodictate import syllables
 
 SLOW_DICTATION_RATE = 260
 """The speed at which to dictate individual words in slow dictation."""
@@ -41,6 +42,16 @@ DEFAULT_RATE = 180
 This only applies when the module is invoked as a script.
 """
 
+_PUNCTUATION_PAUSE_TABLE = [PUNCTUATION_PAUSES.get(chr(i), 0.0)
+                            for i in range(128)]
+"""`PUNCTUATION_PAUSES` as a table indexed by ASCII code point."""
+
+_engine = None
+"""The shared speech engine. Use `_get_engine` to access it."""
+
+_engine_lock = threading.Lock()
+"""Guards the initialization of `_engine`."""
+
 
 def dictate(text, rate):
     """Dictate text at the given rate.
@@ -71,25 +82,16 @@ def _dictate_slow(text, rate):
     pause between each word so that the user can stroke it.
     """
     words = text.split()
-    word_timings = list(_schedule_words(text, rate))
+    word_timings = _schedule_words(text, rate)
 
-    # Engine init takes about a second to start up, so make sure to only start
-    # recording the time after that.
-    engine = pyttsx.init()
+    # Engine init takes about a second to start up the first time, so make sure
+    # to only start recording the time after that.
+    engine = _get_engine()
     start_time = time.time()
 
-    lock = threading.Lock()
     stop_flag = threading.Event()
 
-    class outer(object):
-        num_pending_words = 0
-        num_ticks_of_lag = 0
-
-        previous_location = 0
-        """Used to determine when a word has finished being spoken."""
-
-        current_word = 0
-        """The index of the word currently being spoken."""
+    state = _SlowDictationState()
 
     def get_timestamp():
         """Get the number of seconds since we started dictation."""
@@ -97,75 +99,72 @@ def _dictate_slow(text, rate):
 
     def say_words():
         for i, word in enumerate(words):
-            with lock:
-                outer.current_word = i
-                if stop_flag.is_set():
-                    return
+            state.current_word = i
+            if stop_flag.is_set():
+                return
 
-                # Determine the pause we need for the next word.
-                try:
-                    scheduled_time = word_timings[i + 1]
-                except IndexError:
-                    scheduled_time = 0
+            # Determine the pause we need for the next word.
+            try:
+                scheduled_time = word_timings[i + 1] + state.time_offset
+            except IndexError:
+                scheduled_time = None
 
-                logging.debug("Saying word: {}".format(word))
-                outer.num_pending_words += 1
+            logging.debug("Saying word: {}".format(word))
+            state.num_words_said += 1
 
             if i < len(words) - 1:
                 engine.say(word)
             else:
                 engine.say(word, "final")
 
-            if scheduled_time:
+            if scheduled_time is not None:
                 pause_time = scheduled_time - get_timestamp()
                 if pause_time > 0:
                     stop_flag.wait(pause_time)
 
     def on_word(name, location, length):
         """If the speech engine is falling behind, give it extra time."""
-        with lock:
-            # We can't directly determine if this is a new word or not, so
-            # determine it by seeing if we've started the beginning of a
-            # different word.
-            #
-            # One approach that doesn't work is checking if the location is
-            # zero, because punctation like quotation marks aren't pronounced.
-            # But those punctuation marks might be at the beginning of the
-            # utterance, so the engine would start at a location greater than
-            # zero.
-            old_previous_location = outer.previous_location
-            outer.previous_location = location
-            if location > old_previous_location:
+        # We can't directly determine if this is a new word or not, so
+        # determine it by seeing if we've started the beginning of a different
+        # word.
+        #
+        # One approach that doesn't work is checking if the location is zero,
+        # because punctation like quotation marks aren't pronounced. But those
+        # punctuation marks might be at the beginning of the utterance, so the
+        # engine would start at a location greater than zero.
+        old_previous_location = state.previous_location
+        state.previous_location = location
+        if location > old_previous_location:
+            return
+
+        state.num_words_started += 1
+        num_pending_words = state.num_words_said - state.num_words_started
+        if num_pending_words > 0:
+            state.num_ticks_of_lag += 1
+            logging.debug("Num pending words: {}".format(num_pending_words))
+        else:
+            state.num_ticks_of_lag = 0
+
+        # If we've had pending words for the last few ticks, give the speech
+        # engine a rest and allow it to say words a little bit later.
+        if state.num_ticks_of_lag >= 3:
+            current_word = state.current_word
+            current_time = get_timestamp()
+            next_word_time = word_timings[current_word] + state.time_offset
+            time_difference = current_time - next_word_time
+            time_difference += 0.5
+            if time_difference <= 0:
                 return
 
-            outer.num_pending_words -= 1
-            if outer.num_pending_words:
-                outer.num_ticks_of_lag += 1
-                logging.debug("Num pending words: {}"
-                              .format(outer.num_pending_words))
-            else:
-                outer.num_ticks_of_lag = 0
-
-            # If we've had pending words for the last few ticks, give the
-            # speech engine a rest and allow it to say words a little bit
-            # later.
-            if outer.num_ticks_of_lag >= 3:
-                current_time = get_timestamp()
-                next_word_time = word_timings[outer.current_word]
-                time_difference = current_time - next_word_time
-                time_difference += 0.5
-                if time_difference <= 0:
-                    return
-
-                word_timings[:] = [round(timing + time_difference, 2)
-                                   for timing in word_timings]
-                logging.debug("Giving speech engine {:.2f} seconds"
-                              .format(time_difference))
-                logging.debug("Current time is {:.2f}; next few times are {}"
-                              .format(
-                    current_time,
-                    word_timings[outer.current_word:outer.current_word + 5]
-                ))
+            state.time_offset += time_difference
+            logging.debug("Giving speech engine {:.2f} seconds"
+                          .format(time_difference))
+            logging.debug("Current time is {:.2f}; next few times are {}"
+                          .format(
+                current_time,
+                [round(timing + state.time_offset, 2)
+                 for timing in word_timings[current_word:current_word + 5]]
+            ))
 
     def on_end(name, completed):
         if completed and name == "final":
@@ -173,8 +172,10 @@ def _dictate_slow(text, rate):
             engine.endLoop()
 
     engine.setProperty("rate", SLOW_DICTATION_RATE)
-    engine.connect("started-word", on_word)
-    engine.connect("finished-utterance", on_end)
+    callback_tokens = [
+        engine.connect("started-word", on_word),
+        engine.connect("finished-utterance", on_end),
+    ]
     speech_thread = threading.Thread(target=say_words)
     speech_thread.start()
     try:
@@ -183,19 +184,78 @@ def _dictate_slow(text, rate):
         stop_flag.set()
         speech_thread.join()
     finally:
+        # Ending the loop also clears any words still queued.
         try:
             engine.endLoop()
         except RuntimeError:
             # It was already ended, nothing to do here.
             pass
 
+        # The engine is reused for later dictations, which shouldn't see our
+        # callbacks.
+        for token in callback_tokens:
+            engine.disconnect(token)
+
+
+class _SlowDictationState(object):
+    """State shared between the speech thread and the engine callbacks.
+
+    Each attribute is only ever written by one thread, so they can be shared
+    without a lock.
+    """
+    __slots__ = (
+        "num_words_said",
+        "current_word",
+        "num_words_started",
+        "num_ticks_of_lag",
+        "previous_location",
+        "time_offset",
+    )
+
+    def __init__(self):
+        # Written by the speech thread.
+        self.num_words_said = 0
+        self.current_word = 0
+        """The index of the word currently being spoken."""
+
+        # Written by the started-word callback.
+        self.num_words_started = 0
+        self.num_ticks_of_lag = 0
+        self.previous_location = 0
+        """Used to determine when a word has finished being spoken."""
+        self.time_offset = 0.0
+        """Extra time, added to every word timing, given to the engine."""
+
 
 def _dictate_fast(text, rate):
     """Dictate the text, without doing anything special."""
-    engine = pyttsx.init()
+    engine = _get_engine()
     engine.setProperty("rate", rate)
     engine.say(text)
-    engine.runAndWait()
+    try:
+        engine.runAndWait()
+    finally:
+        # If we were interrupted, the loop is still running and the rest of
+        # the text is still queued. Ending the loop clears the queue, so the
+        # engine is ready for the next dictation.
+        try:
+            engine.endLoop()
+        except RuntimeError:
+            # It was already ended, nothing to do here.
+            pass
+
+
+def _get_engine():
+    """Get the speech engine, initializing it if necessary.
+
+    Initializing the engine takes about a second, so it's done once and the
+    engine is reused for every dictation after that.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = pyttsx.init()
+        return _engine
 
 
 def _schedule_words(text, rate):
@@ -204,25 +264,27 @@ def _schedule_words(text, rate):
     :returns list: A list of floats, starting from 0 and monotonically
     increasing, corresponding to the time at which to say each word.
     """
-    num_syllables = textstat.syllable_count(text)
+    words = text.split()
+    num_syllables = syllables.estimate_syllables(words)
     total_dictation_time = num_syllables * NUM_WORDS_PER_SYLLABLE / rate
     total_dictation_seconds = total_dictation_time * 60.0
 
-    words = text.split()
-    time_per_word = total_dictation_seconds / len(text.split())
+    time_per_word = total_dictation_seconds / len(words)
 
+    # Non-ASCII characters are clamped to DEL, which has no pause.
+    pauses = [_PUNCTUATION_PAUSE_TABLE[min(ord(word[-1]), 127)]
+              for word in words]
+    word_lengths = [time_per_word + time_per_word * pause for pause in pauses]
+
+    timings = [0.0] * len(words)
     current_time = 0.0
-    for word in words:
+    for i, word_length in enumerate(word_lengths):
         # There's no technical reason to round, it's just nice to not have to
         # worry about making a pretty string representation of the list of
         # timings.
-        yield round(current_time, 2)
-
-        word_length = time_per_word
-        punctuation_pause = PUNCTUATION_PAUSES.get(word[-1])
-        if punctuation_pause:
-            word_length += time_per_word * punctuation_pause
+        timings[i] = round(current_time, 2)
         current_time += word_length
+    return timings
 
 
 def main():
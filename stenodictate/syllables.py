@@ -0,0 +1,61 @@
+"""Estimate the number of syllables in a text.
+
+This reproduces the vowel-group heuristic from textstat's `syllable_count`, so
+that dictation is paced the same as when we called into textstat, without
+depending on it.
+"""
+import re
+import string
+
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+"""Matches a run of vowels, which is counted as one syllable."""
+
+_PUNCTUATION_RE = re.compile("[{}]".format(re.escape(string.punctuation)))
+"""Matches punctuation, which is ignored when counting syllables."""
+
+_vowel_group_counts = {}
+"""Memoized vowel group counts, keyed by word."""
+
+
+def estimate_syllables(words):
+    """Estimate the number of syllables in a text, given its words.
+
+    This is the heuristic that textstat applies to a whole text: count the
+    vowel groups, adjust once for a trailing "e" or "le" at the end of the
+    text, count at least one syllable, and take off 10%. Vowel groups never
+    span words, so they can be counted word by word.
+    """
+    last_word = _normalize_word(words[-1])
+    if len(words) == 1 and not last_word:
+        # textstat counts nothing at all for a text that is all punctuation.
+        return 0
+
+    count = sum(_count_vowel_groups(word) for word in words)
+    if last_word.endswith("e"):
+        count -= 1
+    if last_word.endswith("le"):
+        count += 1
+    if count == 0:
+        count = 1
+    return count - (0.1 * count)
+
+
+def _count_vowel_groups(word):
+    """Count the vowel groups in a word, ignoring case and punctuation.
+
+    Texts tend to reuse the same words over and over, so the counts are
+    memoized rather than recomputed for every occurrence. The memo is keyed by
+    the word as it appears in the text, so that a repeated word costs just one
+    lookup.
+    """
+    try:
+        return _vowel_group_counts[word]
+    except KeyError:
+        count = len(_VOWEL_GROUP_RE.findall(_normalize_word(word)))
+        _vowel_group_counts[word] = count
+        return count
+
+
+def _normalize_word(word):
+    """Lowercase a word and strip out its punctuation."""
+    return _PUNCTUATION_RE.sub("", word.lower())
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("pyttsx")
+
+from stenodictate import dictate  # noqa: E402
+
+
+@pytest.mark.parametrize("text, rate, expected", [
+    # Expected values are what `_schedule_words` gave when it called
+    # textstat's `syllable_count` on the whole text.
+    (u"Hello", 30, [0.0]),
+    (u"Hello there, world. How are you?", 60,
+     [0.0, 0.94, 2.58, 4.45, 5.39, 6.33]),
+    (u"Wait… what?! Yes; no: maybe.", 120, [0.0, 0.31, 0.94, 1.56, 2.19]),
+    (u"Café au lait, naïve…", 100, [0.0, 0.47, 0.94, 1.76]),
+    (u"a, a,", 125, [0.0, 0.52]),
+])
+def test_schedule_words(text, rate, expected):
+    assert dictate._schedule_words(text, rate) == expected
@@ -0,0 +1,25 @@
+import pytest
+
+from stenodictate import syllables
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Expected values are what textstat 0.3.1's `syllable_count` gives for the
+    # whole text.
+    ("I like the time and the place we have here, said the one there.", 18.0),
+    ("Mr. Smith paid $100 by 5 pm", 2.7),
+    ("The little table", 4.5),
+    ("Little", 1.8),
+    ("rhythm", 0.9),
+    ("!! ??", 0.9),
+    ("!!", 0),
+])
+def test_estimate_syllables(text, expected):
+    num_syllables = syllables.estimate_syllables(text.split())
+    assert num_syllables == pytest.approx(expected)
+
+
+def test_vowel_group_counts_are_memoized_by_word():
+    syllables._vowel_group_counts.clear()
+    syllables.estimate_syllables(["The", "the,", "The", "the,", "The"])
+    assert syllables._vowel_group_counts == {"The": 1, "the,": 1}